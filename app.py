@@ -1,33 +1,243 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import SQLAlchemyError
 from flask_cors import CORS
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 import requests
+import http.cookiejar
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import spacy
-from sklearn.cluster import KMeans
-from sklearn.feature_extraction.text import TfidfVectorizer
 import redis
-import json
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import itertools
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+import orjson
 import random
+import time
+import queue
+import threading
+import re
+import sys
+import signal
+import ctypes
 import os
 
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson for request parsing and jsonify.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Question templates as (question format, options key) pairs
+QUESTION_TEMPLATES = (
+    ("What is your opinion on '{}'?", "opinion"),
+    ("Would you like to learn more about '{}'?", "yes_no"),
+    ("How important is '{}' to you?", "importance"),
+    ("Where do you think '{}' fits best?", "fit"),
+    ("On a scale of 1-5, how would you rate your interest in '{}'?", "interest"),
+    ("Do you agree with the statement: '{}' is revolutionary?", "agreement"),
+    ("What challenges might you foresee with '{}'?", "challenges"),
+)
+
+# Multiple-choice options per question type
+QUESTION_OPTIONS = {
+    "opinion": ("Positive", "Negative", "Neutral"),
+    "yes_no": ("Yes", "No"),
+    "importance": ("Not at all", "Somewhat", "Very important"),
+    "fit": ("Technology", "Science", "Business", "Other"),
+    "interest": ("1", "2", "3", "4", "5"),
+    "agreement": ("Agree", "Disagree", "Neutral"),
+    "challenges": ("Lack of resources", "Public resistance", "Technological barriers", "Other"),
+}
+
+# Question IDs, increasing from the start time in milliseconds (see next_question_id)
+QUESTION_IDS = itertools.count(int(time.time() * 1000))
+
+def next_question_id():
+    """
+    Next question ID: the counter in the high bits and the low 10 bits of the pid below it.
+    gunicorn workers inherit the same counter value from the preloaded master, so the pid
+    is what keeps their IDs apart. Results stay below 2**53, safe for JavaScript clients.
+    """
+    return (next(QUESTION_IDS) << 10) | (os.getpid() & 0x3FF)
+
+# Upper bound on topics (and so questions) generated per URL
+MAX_TOPICS = 20
+
+# Boilerplate fragments that disqualify a question, matched in a single scan
+BLACKLISTED_PHRASES = ("Terms and Conditions", "Privacy Policy", "CA Notice", "see our")
+BLACKLIST_RE = re.compile("|".join(map(re.escape, BLACKLISTED_PHRASES)))
+
+# Shared HTTP session so scrapes reuse TCP/TLS connections per host
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.2))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+# ...but never keep cookies, so one user's scrape can't change what another user's returns
+SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+# Most (decompressed) bytes of a page that are read and parsed
+MAX_CONTENT_BYTES = 2_000_000
+
+def normalize_url(url):
+    """
+    Canonical form of a URL: default http:// scheme, lowercased scheme and host,
+    "/" for an empty path and no fragment. Used for both caching and scraping.
+    """
+    url = url.strip()
+    if not url.lower().startswith(("http://", "https://")):
+        url = "http://" + url
+    parts = urlsplit(url)
+    # Only the host (and port) is case-insensitive; any user:password before it is kept as is
+    userinfo, at, hostport = parts.netloc.rpartition("@")
+    netloc = userinfo + at + hostport.lower()
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path or "/", parts.query, ""))
+
+def cache_key(url):
+    """
+    Fixed-width Redis key for a URL, namespaced so cached questions are easy to find and drop.
+    """
+    return "cq:" + hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+# Most characters of scraped content that are run through NLP
+MAX_NLP_CHARS = 50_000
+
+# SpaCy model, loaded once per process (parent and every NLP worker)
+nlp = None
+
+def _load_nlp():
+    # Only sentence boundaries (parser) and entities (ner) are used, so don't load the rest
+    global nlp
+    if nlp is None:
+        nlp = spacy.load("en_core_web_sm", exclude=["tagger", "attribute_ruler", "lemmatizer"])
+        nlp.max_length = MAX_NLP_CHARS + 10_000  # Fail fast on anything that slipped past the cap
+
+# prctl option asking Linux to signal a process when its parent dies
+PR_SET_PDEATHSIG = 1
+
+def _init_nlp_worker(parent_pid):
+    """
+    Initializer for NLP worker processes. They are forked from a gunicorn worker before it
+    installs its own signal handlers, so they would otherwise keep the master's handlers,
+    which only queue signals. Also makes them exit with their parent instead of blocking
+    forever on its pipes if the parent is killed.
+    """
+    for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGQUIT):
+        signal.signal(sig, signal.SIG_DFL)
+    if sys.platform.startswith("linux"):
+        ctypes.CDLL(None).prctl(PR_SET_PDEATHSIG, signal.SIGTERM)
+        if os.getppid() != parent_pid:  # Parent already gone before prctl took effect
+            os._exit(1)
+    _load_nlp()
+
+# NLP worker pool, created separately in every process that uses it (see get_nlp_pool)
+_nlp_pool = None
+_nlp_pool_pid = None
+_nlp_pool_lock = threading.Lock()
+
+def get_nlp_pool():
+    """
+    Returns this process's NLP pool, creating it on first use. The pool's queues and pipes
+    must not be shared between forked gunicorn workers, so it is keyed on the pid and never
+    built in the preloaded master.
+    """
+    global _nlp_pool, _nlp_pool_pid
+    with _nlp_pool_lock:
+        if _nlp_pool_pid != os.getpid():
+            # Under gunicorn the NLP_WORKERS default is derived from the worker count (gunicorn.conf.py)
+            nlp_workers = int(os.environ.get('NLP_WORKERS', max(1, min((os.cpu_count() or 1) - 1, 4))))
+            mp_context = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+            _nlp_pool = ProcessPoolExecutor(max_workers=nlp_workers, mp_context=mp_context,
+                                           initializer=_init_nlp_worker, initargs=(os.getpid(),))
+            _nlp_pool.submit(_load_nlp).result()  # Start the worker processes now
+            _nlp_pool_pid = os.getpid()
+        return _nlp_pool
+
+def _discard_nlp_pool(pool):
+    # Drop a broken pool so the next get_nlp_pool call in this process builds a fresh one
+    global _nlp_pool_pid
+    with _nlp_pool_lock:
+        if _nlp_pool is pool:
+            _nlp_pool_pid = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def extract_topics(content, timeout):
+    """
+    Runs _extract_topics in this process's NLP pool, waiting at most `timeout` seconds.
+    A timed-out job is cancelled, or skipped by the worker if it was already handed over,
+    so abandoned jobs don't pile up in front of later requests. If the pool's processes
+    have died (OOM killer, segfault) the pool is replaced and the job retried once.
+    """
+    for attempt in range(2):
+        pool = get_nlp_pool()
+        try:
+            future = pool.submit(_extract_topics, content, time.time() + timeout)
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+        except BrokenProcessPool:
+            print("NLP worker pool is broken, rebuilding it")
+            _discard_nlp_pool(pool)
+            if attempt:
+                raise
+
+def _extract_topics(content, deadline):
+    """
+    Runs in an NLP worker process. Returns plain lists so no Doc has to be pickled back.
+    Jobs picked up after `deadline` have already been answered with a timeout and are skipped.
+    """
+    if time.time() > deadline:
+        return [], []
+    chunks = [chunk for chunk in content.split("\n\n") if chunk.strip()]
+    sentences = []
+    entities = []
+    for doc in nlp.pipe(chunks, batch_size=64):
+        sentences.extend(sent.text.strip() for sent in doc.sents if len(sent.text.strip()) > 5)
+        entities.extend(ent.text.strip() for ent in doc.ents if ent.label_ in {"PERSON", "ORG", "GPE", "PRODUCT", "EVENT"})
+    return sentences, entities
+
 # Initialize app with create_app function
 def create_app():
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     app.config['DEBUG'] = True
     CORS(app, resources={r"/*": {"origins": "*", "supports_credentials": True}})
 
     # Redis configuration from environment variables
-    redis_host = os.environ.get('REDIS_HOST')
-    redis_port = os.environ.get('REDIS_PORT')
+    redis_host = os.environ.get('REDIS_HOST') or 'localhost'
+    redis_port = int(os.environ.get('REDIS_PORT') or 6379)
     redis_password = os.environ.get('REDIS_PASSWORD')
 
-    # Connect to Redis for caching
-    redis_cache = redis.StrictRedis(host=redis_host, port=redis_port, password=redis_password, db=0, decode_responses=True)
-    redis_cache.flushall()  # Redis reset
+    # Connect to Redis for caching through a shared, explicitly sized pool
+    redis_pool = redis.ConnectionPool(host=redis_host, port=redis_port, password=redis_password, db=0,
+                                      max_connections=64, socket_keepalive=True,
+                                      socket_connect_timeout=2, health_check_interval=30)
+    redis_cache = redis.StrictRedis(connection_pool=redis_pool)
+
+    # Cached responses expire after CACHE_TTL seconds; bodies over CACHE_MAX_BYTES are not cached
+    cache_ttl = int(os.environ.get('CACHE_TTL', 86400))
+    cache_max_bytes = int(os.environ.get('CACHE_MAX_BYTES', 65536))
 
-    # Set up NLP
-    nlp = spacy.load("en_core_web_sm")
+    @app.cli.command("flush-cache")
+    def flush_cache():
+        """Redis reset (run manually, e.g. `flask --app run flush-cache`)."""
+        redis_cache.flushall()
+
+    # Set up NLP: load the model before forking so workers share its pages; the
+    # pool of NLP processes is started per worker by get_nlp_pool
+    _load_nlp()
+    nlp_timeout = int(os.environ.get('NLP_TIMEOUT', 15))  # Longest a request waits on NLP before a 504
 
     # PostgreSQL configuration using Flask-SQLAlchemy
     DB_HOST = os.environ.get('DB_HOST')
@@ -37,20 +247,50 @@ def create_app():
 
     app.config['SQLALCHEMY_DATABASE_URI'] = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}"
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Keep a bounded pool of open connections instead of reconnecting under load
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        "pool_size": int(os.environ.get('DB_POOL_SIZE', 5)),
+        "max_overflow": int(os.environ.get('DB_MAX_OVERFLOW', 15)),
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
 
     db = SQLAlchemy(app)
 
-    # Define the Questions model
+    # Define the Questions model (options stored as a single JSONB array)
     class Question(db.Model):
+        __tablename__ = 'questions'
         id = db.Column(db.Integer, primary_key=True)
         url = db.Column(db.String, nullable=False)
         question = db.Column(db.String, nullable=False)
-        option1 = db.Column(db.String, nullable=True)
-        option2 = db.Column(db.String, nullable=True)
-        option3 = db.Column(db.String, nullable=True)
-        option4 = db.Column(db.String, nullable=True)
+        options = db.Column(JSONB, nullable=False)
         created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
 
+    # Create the schema once at startup so no request ever has to, then drop
+    # the connection it used so forked gunicorn workers never share a socket.
+    # The table is only best-effort tracking, so a DB outage mustn't stop the app booting
+    with app.app_context():
+        try:
+            db.create_all()
+        except SQLAlchemyError as e:
+            print(f"Error creating DB schema: {e}")
+        db.engine.dispose()
+
+    # Questions waiting to be written to PostgreSQL by the background writer thread
+    write_queue = queue.Queue(maxsize=10000)
+    writer_pid = None
+    writer_lock = threading.Lock()
+
+    @app.route('/healthz', methods=['GET'])
+    def healthz():
+        # Redis connectivity is checked here on demand rather than at startup
+        try:
+            redis_cache.ping()
+            return jsonify({"status": "ok"})
+        except redis.exceptions.RedisError as e:
+            print(f"Redis error: {e}")
+            return jsonify({"status": "error", "error": "Cache service failure"}), 503
+
     @app.route('/classify', methods=['POST'])
     def classify():
         try:
@@ -60,14 +300,13 @@ def create_app():
             if not url:
                 return jsonify({"error": "No URL provided"}), 400
 
-            # Ensure the URL starts with "http"
-            if not url.startswith("http"):
-                url = "http://" + url
+            # Normalize once so equivalent URLs share a cache entry
+            url = normalize_url(url)
 
-            # Check Redis Cache
-            cached_data = redis_cache.get(url)
-            if cached_data:
-                return jsonify({"questions": json.loads(cached_data)})
+            # Check Redis Cache (holds the serialized response body, returned as-is)
+            cached_body = redis_cache.get(cache_key(url))
+            if cached_body:
+                return Response(cached_body, status=200, mimetype='application/json')
 
             # Scrape the URL content
             content = scrape_content(url)
@@ -77,39 +316,49 @@ def create_app():
             # Generate Questions
             questions = generate_questions(content, from_url=True)
 
-            # Cache and store questions
-            store_questions_in_db(url, questions)
-            redis_cache.set(url, json.dumps(questions))
+            # Cache questions, then hand them to the background writer for the DB
+            body = orjson.dumps({"questions": questions})
+            if len(body) <= cache_max_bytes:
+                redis_cache.set(cache_key(url), body, ex=cache_ttl)
+            enqueue_questions(url, questions)
 
-            return jsonify({"questions": questions})
+            return Response(body, status=200, mimetype='application/json')
 
         except redis.exceptions.RedisError as e:
             print(f"Redis error: {e}")
             return jsonify({"error": "Cache service failure"}), 500
+        except FutureTimeoutError:
+            print(f"NLP processing timed out after {nlp_timeout}s")
+            return jsonify({"error": "Content processing timed out"}), 504
         except Exception as e:
             print(f"Error in classify endpoint: {e}")
             return jsonify({"error": str(e)}), 500
 
     def scrape_content(url):
         try:
-            if not url.startswith("http"):
-                url = "http://" + url
-
-            # Add a User-Agent header to mimic a browser request
+            # Add a User-Agent header to mimic a browser request, and accept compressed bodies
             headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                'Accept-Encoding': 'gzip, deflate'
             }
 
-            # Use headers in the GET request
-            response = requests.get(url, headers=headers, timeout=5)
-
-            if response.status_code != 200:
-                print(f"Failed to fetch content from {url} with status code: {response.status_code}")
-                return None
-
-            soup = BeautifulSoup(response.content, "html.parser")
-            paragraphs = [p.get_text() for p in soup.find_all("p")]
-            return " ".join(paragraphs)
+            # Use headers in the GET request (connect timeout, read timeout), streaming the body
+            with SESSION.get(url, headers=headers, timeout=(2, 5), stream=True) as response:
+                if response.status_code != 200:
+                    print(f"Failed to fetch content from {url} with status code: {response.status_code}")
+                    return None
+
+                # Refuse oversized pages up front, otherwise read at most MAX_CONTENT_BYTES
+                content_length = response.headers.get('Content-Length')
+                if content_length and content_length.isdigit() and int(content_length) > MAX_CONTENT_BYTES:
+                    print(f"Content from {url} is too large: {content_length} bytes")
+                    return None
+                body = response.raw.read(MAX_CONTENT_BYTES, decode_content=True)
+
+            # Parse with selectolax (native code) and pull the text out of every <p>
+            tree = HTMLParser(body)
+            paragraphs = [p.text(deep=True) for p in tree.css("p")]
+            return "\n\n".join(paragraphs)
         except requests.exceptions.Timeout:
             print(f"Request to {url} timed out.")
             return None
@@ -121,68 +370,36 @@ def create_app():
             return None
 
     def generate_questions(content, from_url=True):
-        # Process content with SpaCy NLP
-        doc = nlp(content)
-        sentences = [sent.text.strip() for sent in doc.sents if len(sent.text.strip()) > 5]
-        entities = [ent.text.strip() for ent in doc.ents if ent.label_ in {"PERSON", "ORG", "GPE", "PRODUCT", "EVENT"}]
+        # Process content with SpaCy NLP in a worker process, trimmed to a bounded size
+        sentences, entities = extract_topics(content[:MAX_NLP_CHARS], nlp_timeout)
 
         # Organize topics into categories: entities vs. sentences
-        topics = list(set(entities + sentences[:10]))  # Deduplicate topics
+        seen = set()
+        topics = []
+        for topic in itertools.chain(entities, sentences[:10]):
+            if topic not in seen:  # Deduplicate topics
+                seen.add(topic)
+                topics.append(topic)
 
         # Intelligent fallback if less than 3 topics are found
         if len(topics) < 3:
             fallback_topic = categorize_fallback(content)
             topics += fallback_topic  # Add more contextual fallback topics
 
-        # Shuffle topics to ensure randomness
-        random.shuffle(topics)
-
-        # Define question templates with dynamic options based on the content
-        question_templates = [
-            lambda t: {
-                "questionId": random.randint(1000, 9999),
-                "question": f"What is your opinion on '{t}'?",
-                "options": generate_dynamic_options(t, "opinion")
-            },
-            lambda t: {
-                "questionId": random.randint(1000, 9999),
-                "question": f"Would you like to learn more about '{t}'?",
-                "options": ["Yes", "No"]
-            },
-            lambda t: {
-                "questionId": random.randint(1000, 9999),
-                "question": f"How important is '{t}' to you?",
-                "options": generate_dynamic_options(t, "importance")
-            },
-            lambda t: {
-                "questionId": random.randint(1000, 9999),
-                "question": f"Where do you think '{t}' fits best?",
-                "options": generate_dynamic_options(t, "fit")
-            },
-            lambda t: {
-                "questionId": random.randint(1000, 9999),
-                "question": f"On a scale of 1-5, how would you rate your interest in '{t}'?",
-                "options": generate_dynamic_options(t, "interest")
-            },
-            lambda t: {
-                "questionId": random.randint(1000, 9999),
-                "question": f"Do you agree with the statement: '{t}' is revolutionary?",
-                "options": generate_dynamic_options(t, "agreement")
-            },
-            lambda t: {
-                "questionId": random.randint(1000, 9999),
-                "question": f"What challenges might you foresee with '{t}'?",
-                "options": generate_dynamic_options(t, "challenges")
-            },
-        ]
+        # Pick a random, bounded selection of topics in random order
+        topics = random.sample(topics, min(len(topics), MAX_TOPICS))
 
         # Generate questions from URL content (if from_url is True)
         url_based_questions = []
         if from_url:
             # Ensure all questions come from the URL content
             for topic in topics:
-                template = random.choice(question_templates)
-                question_data = template(topic)
+                question_format, options_key = random.choice(QUESTION_TEMPLATES)
+                question_data = {
+                    "questionId": next_question_id(),
+                    "question": question_format.format(topic),
+                    "options": generate_dynamic_options(topic, options_key)
+                }
                 if filter_questions(question_data):
                     url_based_questions.append(question_data)
 
@@ -192,7 +409,7 @@ def create_app():
         # Fallback question if none are generated
         if not questions:
             questions.append({
-                "questionId": random.randint(1000, 9999),
+                "questionId": next_question_id(),
                 "question": "What is your overall impression of this content?",
                 "options": ["Interesting", "Boring", "Confusing"]
             })
@@ -215,9 +432,7 @@ def create_app():
             return False  # Fix improper punctuation
 
         # Remove nonsensical fragments
-        if "Terms and Conditions" in question or "Privacy Policy" in question:
-            return False
-        if any(phrase in question for phrase in ["CA Notice", "see our"]):
+        if BLACKLIST_RE.search(question):
             return False
 
         return True
@@ -227,36 +442,57 @@ def create_app():
         Generates dynamic multiple-choice options based on the topic and question type.
         The question type helps tailor the options more specifically to the context.
         """
-        if question_type == "opinion":
-            return ["Positive", "Negative", "Neutral"]
-        elif question_type == "importance":
-            return ["Not at all", "Somewhat", "Very important"]
-        elif question_type == "fit":
-            return ["Technology", "Science", "Business", "Other"]
-        elif question_type == "interest":
-            return ["1", "2", "3", "4", "5"]
-        elif question_type == "agreement":
-            return ["Agree", "Disagree", "Neutral"]
-        elif question_type == "challenges":
-            return ["Lack of resources", "Public resistance", "Technological barriers", "Other"]
-        else:
-            return []
-
-    def store_questions_in_db(url, questions):
+        return QUESTION_OPTIONS.get(question_type, ())
+
+    def enqueue_questions(url, questions):
+        """
+        Queue questions for the background writer, starting it in this process if needed
+        (threads don't survive gunicorn's fork). Writes synchronously if the queue is full.
+        """
+        nonlocal writer_pid
+        with writer_lock:
+            if writer_pid != os.getpid():
+                threading.Thread(target=write_questions_worker, daemon=True).start()
+                writer_pid = os.getpid()
+        try:
+            write_queue.put_nowait((url, questions))
+        except queue.Full:
+            store_questions_in_db([(url, questions)])
+
+    def write_questions_worker():
+        """
+        Drains the write queue, inserting up to 200 URLs' questions (or 100 ms worth) per batch.
+        A failing batch is logged and dropped; the thread keeps running, since nothing restarts it.
+        """
+        while True:
+            try:
+                batch = [write_queue.get()]
+                deadline = time.monotonic() + 0.1
+                while len(batch) < 200:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(write_queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                with app.app_context():
+                    store_questions_in_db(batch)
+            except Exception as e:
+                print(f"Error in background DB writer: {e}")
+
+    def store_questions_in_db(batch):
         """
-        Store questions in PostgreSQL for tracking.
+        Store questions in PostgreSQL for tracking. `batch` is a list of (url, questions) pairs.
         """
         try:
-            for question in questions:
-                new_question = Question(
-                    url=url,
-                    question=question['question'],
-                    option1=question['options'][0],
-                    option2=question['options'][1] if len(question['options']) > 1 else None,
-                    option3=question['options'][2] if len(question['options']) > 2 else None,
-                    option4=question['options'][3] if len(question['options']) > 3 else None
-                )
-                db.session.add(new_question)
+            rows = [
+                {"url": url, "question": question['question'], "options": list(question['options'])}
+                for url, questions in batch
+                for question in questions
+            ]
+            # Single executemany INSERT instead of one ORM object per row
+            db.session.execute(Question.__table__.insert(), rows)
             db.session.commit()
         except Exception as e:
             db.session.rollback()
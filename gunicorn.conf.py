@@ -0,0 +1,19 @@
+# Gunicorn settings, picked up automatically by `gunicorn run:app`
+import os
+
+# Load the app (and the SpaCy model) once in the master, then fork workers that share it copy-on-write
+preload_app = True
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_class = "gthread"
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = 30
+
+# Every worker runs its own pool of NLP_WORKERS SpaCy processes, so unless it is set
+# explicitly, split the CPUs between the workers instead of giving each its own set
+os.environ.setdefault('NLP_WORKERS', str(max(1, (os.cpu_count() or 1) // workers)))
+
+def post_fork(server, worker):
+    # Start this worker's own NLP pool before its request threads exist, so the
+    # NLP processes are forked from a single-threaded worker
+    from app import get_nlp_pool
+    get_nlp_pool()
@@ -0,0 +1,22 @@
+import app
+
+
+def test_create_app_starts_when_postgres_is_unreachable(monkeypatch, capsys):
+    # Nothing listens on port 1; the SpaCy model isn't needed to build the app
+    monkeypatch.setenv("DB_HOST", "127.0.0.1:1")
+    monkeypatch.setattr(app, "nlp", object())
+
+    flask_app = app.create_app()
+
+    assert "classify" in flask_app.view_functions
+    assert "Error creating DB schema" in capsys.readouterr().out
+
+
+def test_normalize_url_canonicalizes_scheme_host_and_fragment():
+    assert app.normalize_url(" Example.com/Path#top ") == "http://example.com/Path"
+    assert app.normalize_url("HTTPS://Example.com:8443?q=A") == "https://example.com:8443/?q=A"
+
+
+def test_normalize_url_keeps_credentials_intact():
+    assert app.normalize_url("http://User:PW@Host.com/x") == "http://User:PW@host.com/x"
+    assert app.normalize_url("http://[2001:DB8::1]:8080/") == "http://[2001:db8::1]:8080/"
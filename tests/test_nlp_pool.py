@@ -0,0 +1,94 @@
+import os
+import signal
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+import app
+
+
+class SlowNLP:
+    """
+    Stands in for the SpaCy model: pipe() takes a second on "slow" content and finds nothing.
+    """
+    def pipe(self, chunks, batch_size=64):
+        if chunks == ["slow"]:
+            time.sleep(1.0)
+        return []
+
+
+@pytest.fixture
+def nlp_pool(monkeypatch):
+    # A fresh single-process pool, forked after the fake model is in place
+    monkeypatch.setenv("NLP_WORKERS", "1")
+    monkeypatch.setattr(app, "nlp", SlowNLP())
+    monkeypatch.setattr(app, "_nlp_pool_pid", None)
+    pool = app.get_nlp_pool()
+    yield pool
+    app._discard_nlp_pool(pool)
+
+
+def test_timed_out_jobs_do_not_delay_later_requests(nlp_pool):
+    for _ in range(3):
+        with pytest.raises(FutureTimeoutError):
+            app.extract_topics("slow", timeout=0.2)
+
+    # Only the job already running when the first timeout hit may still be ahead of this one
+    started = time.monotonic()
+    assert app.extract_topics("fast", timeout=5) == ([], [])
+    assert time.monotonic() - started < 0.9
+
+
+def _nlp_process_pids(pool):
+    return list(pool._processes)
+
+
+def _wait_for_exit(pid, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_nlp_process_dies_on_sigterm_despite_inherited_handler(monkeypatch):
+    # Like the gunicorn master's handlers, which only queue the signal
+    previous = signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    try:
+        monkeypatch.setenv("NLP_WORKERS", "1")
+        monkeypatch.setattr(app, "nlp", SlowNLP())
+        monkeypatch.setattr(app, "_nlp_pool_pid", None)
+        pool = app.get_nlp_pool()
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+    try:
+        (pid,) = _nlp_process_pids(pool)
+        os.kill(pid, signal.SIGTERM)
+        assert _wait_for_exit(pid)
+    finally:
+        app._discard_nlp_pool(pool)
+
+
+def test_nlp_process_exits_when_its_worker_is_killed(monkeypatch):
+    monkeypatch.setenv("NLP_WORKERS", "1")
+    monkeypatch.setattr(app, "nlp", SlowNLP())
+    read_fd, write_fd = os.pipe()
+    worker = os.fork()
+    if worker == 0:
+        # Stands in for a gunicorn worker: start a pool, report its NLP pid, then wait to be killed
+        try:
+            app._nlp_pool_pid = None
+            (pid,) = _nlp_process_pids(app.get_nlp_pool())
+            os.write(write_fd, str(pid).encode())
+            time.sleep(30)
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    pid = int(os.read(read_fd, 32))
+    os.kill(worker, signal.SIGKILL)
+    os.waitpid(worker, 0)
+    assert _wait_for_exit(pid)
@@ -0,0 +1,39 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+import app
+
+
+class CookieHandler(BaseHTTPRequestHandler):
+    """
+    Sets a cookie on every response and echoes back any cookie the client sent.
+    """
+    def do_GET(self):
+        body = (self.headers.get("Cookie") or "").encode()
+        self.send_response(200)
+        self.send_header("Set-Cookie", "meter=1; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = HTTPServer(("127.0.0.1", 0), CookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_does_not_carry_cookies_between_scrapes(server_url):
+    app.SESSION.get(server_url, timeout=5)
+    response = app.SESSION.get(server_url, timeout=5)
+    assert response.text == ""
+    assert len(app.SESSION.cookies) == 0